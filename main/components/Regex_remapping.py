@@ -4,44 +4,98 @@ This module is used to remap the Tableau SQL to Fabric SQL using regex, for comm
 Naturally this means that all the patterns that are not supported by Fabric SQL will be flagged for manual review.
 """
 
-import re
+# Third-party regex module instead of stdlib re: VERSION1 behavior plus
+# concurrent=True on the hot sub/search calls, which releases the GIL during
+# matching so batch conversions can run in real threads.
+import regex as re
 from typing import List, Tuple, Optional, Dict
 
 
 Flag = Tuple[int, str]  # (line_number, reason)
 
+# All patterns here are ASCII SQL; IGNORECASE + VERSION1 is all we need
+_FLAGS = re.IGNORECASE | re.VERSION1
+
 
 class RegexRemapper:
+    # Trigger substrings per rewrite pass, checked against the uppercased SQL.
+    # Every regex match necessarily contains its trigger literal, so a missing
+    # trigger means the pass cannot match and is skipped entirely. False
+    # positives (e.g. 'INT' inside 'INTO') just run a pass that finds nothing.
+    _PASS_TRIGGERS = {
+        'renames': ('IF', 'NOW', 'TODAY', 'LENGTH', 'SUBSTR', 'MAKEDATE',
+                    'LN', 'LOG', 'TRUE', 'FALSE', '//'),
+        'brackets': ('[',),
+        'casts': ('INT', 'STR', 'FLOAT', 'DATE'),
+        'str_fns': ('SPLIT', 'STARTSWITH', 'ENDSWITH', 'CONTAINS', 'FIND'),
+        'median': ('MEDIAN',),
+        'lod': ('FIXED', 'INCLUDE', 'EXCLUDE'),
+    }
+
+    # Precompiled patterns used across remaps, compiled once per process at
+    # class definition time; instances only carry varchar_default_len.
+    # NOTE: used AI to help generate these patterns
+    # Possessive quantifiers (++, *+) never backtrack, keeping worst-case
+    # match time linear even on malformed SQL
+    re_bracket_ident = re.compile(r"\[([^\]]++)\]")
+    # All simple literal renames fused into a single alternation so remap()
+    # walks the string once instead of once per pattern. Dispatch happens
+    # by named group via m.lastgroup.
+    re_renames = re.compile(
+        r"(?P<IFNULL>\bIFNULL\s*\()"
+        r"|(?P<IF>\bIF\s*\()"
+        r"|(?P<NOW>\bNOW\s*\(\s*\))"
+        r"|(?P<TODAY>\bTODAY\s*\(\s*\))"
+        r"|(?P<LENGTH>\bLENGTH\s*\()"
+        r"|(?P<SUBSTR>\bSUBSTR\s*\()"
+        r"|(?P<MAKEDATETIME>\bMAKEDATETIME\s*\()"
+        r"|(?P<MAKEDATE>\bMAKEDATE\s*\()"
+        r"|(?P<LN>\bLN\s*\()"
+        r"|(?P<LOG>\bLOG\s*\()"
+        r"|(?P<TRUE>\bTRUE\b)"
+        r"|(?P<FALSE>\bFALSE\b)",
+        _FLAGS)
+    _rename_repl = {
+        'IFNULL': 'ISNULL(',
+        'IF': 'IIF(',
+        'NOW': 'GETDATE()',
+        'TODAY': 'CAST(GETDATE() AS DATE)',
+        'LENGTH': 'LEN(',
+        'SUBSTR': 'SUBSTRING(',
+        'MAKEDATETIME': 'DATETIMEFROMPARTS(',
+        'MAKEDATE': 'DATEFROMPARTS(',
+        'LN': 'LOG(',
+        'LOG': 'LOG10(',
+        'TRUE': '1',
+        'FALSE': '0',
+    }
+    # INT/STR/FLOAT/DATE share one shape, so one pattern covers all four;
+    # the replacement callback picks the target T-SQL type by matched name
+    re_casts = re.compile(r"\b(INT|STR|FLOAT|DATE)\s*\(\s*([^\)]++)\)", _FLAGS)
+    # SPLIT/STARTSWITH/ENDSWITH/CONTAINS/FIND share one shape, so a single
+    # alternation handles all five in one pass; VERSION1 lets each branch
+    # reuse the fn/arg/lit group names and the callback dispatches on fn
+    re_str_fns = re.compile(
+        r"\b(?P<fn>SPLIT)\s*\(\s*(?P<arg>[^,]++),\s*'(?P<lit>[^']*+)'\s*,\s*(?P<idx>\d++)\s*\)"
+        r"|\b(?P<fn>STARTSWITH)\s*\(\s*(?P<arg>[^,]++),\s*'(?P<lit>[^']*+)'\s*\)"
+        r"|\b(?P<fn>ENDSWITH)\s*\(\s*(?P<arg>[^,]++),\s*'(?P<lit>[^']*+)'\s*\)"
+        r"|\b(?P<fn>CONTAINS)\s*\(\s*(?P<arg>[^,]++),\s*'(?P<lit>[^']*+)'\s*(?:,\s*[^\)]*+)?\)"
+        r"|\b(?P<fn>FIND)\s*\(\s*(?P<arg>[^,]++),\s*'(?P<lit>[^']*+)'\s*\)",
+        _FLAGS)
+    re_lod = re.compile(r"\{\s*(FIXED|INCLUDE|EXCLUDE)\b", _FLAGS)
+    re_median = re.compile(r"\bMEDIAN\s*\(\s*([^\)]++)\)", _FLAGS)
+    # Loose per-line variant for flagging (a call may span lines)
+    re_median_flag = re.compile(r"\bMEDIAN\s*\(", _FLAGS)
+
     def __init__(self, varchar_default_len: int = 20) -> None:
         self.varchar_default_len = varchar_default_len
-
-        # Precompiled patterns used across remaps
-        # NOTE: used AI to help generate these patterns
-        self.re_bracket_ident = re.compile(r"\[([^\]]+)\]")
-        self.re_if = re.compile(r"\bIF\s*\(", re.IGNORECASE)
-        self.re_ifnull = re.compile(r"\bIFNULL\s*\(", re.IGNORECASE)
-        self.re_true = re.compile(r"\bTRUE\b", re.IGNORECASE)
-        self.re_false = re.compile(r"\bFALSE\b", re.IGNORECASE)
-        self.re_comment_slashes = re.compile(r"//")
-        self.re_now = re.compile(r"\bNOW\s*\(\s*\)", re.IGNORECASE)
-        self.re_today = re.compile(r"\bTODAY\s*\(\s*\)", re.IGNORECASE)
-        self.re_length = re.compile(r"\bLENGTH\s*\(", re.IGNORECASE)
-        self.re_substr = re.compile(r"\bSUBSTR\s*\(", re.IGNORECASE)
-        self.re_makedate = re.compile(r"\bMAKEDATE\s*\(", re.IGNORECASE)
-        self.re_makedatetime = re.compile(r"\bMAKEDATETIME\s*\(", re.IGNORECASE)
-        self.re_ln = re.compile(r"\bLN\s*\(", re.IGNORECASE)
-        self.re_log = re.compile(r"\bLOG\s*\(", re.IGNORECASE)
-        self.re_int = re.compile(r"\bINT\s*\(\s*([^\)]+?)\s*\)", re.IGNORECASE)
-        self.re_str = re.compile(r"\bSTR\s*\(\s*([^\)]+?)\s*\)", re.IGNORECASE)
-        self.re_float = re.compile(r"\bFLOAT\s*\(\s*([^\)]+?)\s*\)", re.IGNORECASE)
-        self.re_date_cast = re.compile(r"\bDATE\s*\(\s*([^\)]+?)\s*\)", re.IGNORECASE)
-        self.re_split = re.compile(r"\bSPLIT\s*\(\s*([^,]+?)\s*,\s*'([^']*)'\s*,\s*(\d+)\s*\)", re.IGNORECASE)
-        self.re_startswith = re.compile(r"\bSTARTSWITH\s*\(\s*([^,]+?)\s*,\s*'([^']*)'\s*\)", re.IGNORECASE)
-        self.re_endswith = re.compile(r"\bENDSWITH\s*\(\s*([^,]+?)\s*,\s*'([^']*)'\s*\)", re.IGNORECASE)
-        self.re_contains = re.compile(r"\bCONTAINS\s*\(\s*([^,]+?)\s*,\s*'([^']*)'\s*(?:,\s*[^\)]*)?\)", re.IGNORECASE)
-        self.re_find = re.compile(r"\bFIND\s*\(\s*([^,]+?)\s*,\s*'([^']*)'\s*\)", re.IGNORECASE)
-        self.re_lod = re.compile(r"\{\s*(FIXED|INCLUDE|EXCLUDE)\b", re.IGNORECASE)
-        self.re_median = re.compile(r"\bMEDIAN\s*\(\s*([^\)]+?)\s*\)", re.IGNORECASE)
+        # Built once here because the STR target depends on the default length
+        self._cast_to = {
+            'INT': 'INT',
+            'FLOAT': 'FLOAT',
+            'DATE': 'DATE',
+            'STR': f'VARCHAR({varchar_default_len})',
+        }
 
     def remap(self, sql: str) -> Tuple[str, List[Flag]]:
         """
@@ -54,89 +108,102 @@ class RegexRemapper:
         if not sql:
             return sql, flags
 
-        # Normalize comments style
-        sql = self.re_comment_slashes.sub('--', sql)
-
-        # Replace booleans
-        sql = self.re_true.sub('1', sql)
-        sql = self.re_false.sub('0', sql)
-
-        # Common function name rewrites
-        sql = self.re_if.sub('IIF(', sql)
-        sql = self.re_ifnull.sub('ISNULL(', sql)
-        sql = self.re_now.sub('GETDATE()', sql)
-        sql = self.re_today.sub('CAST(GETDATE() AS DATE)', sql)
-        sql = self.re_length.sub('LEN(', sql)
-        sql = self.re_substr.sub('SUBSTRING(', sql)
-        sql = self.re_makedate.sub('DATEFROMPARTS(', sql)
-        sql = self.re_makedatetime.sub('DATETIMEFROMPARTS(', sql)
-        sql = self.re_ln.sub('LOG(', sql)
-        sql = self.re_log.sub('LOG10(', sql)
+        # Split once up front; the MEDIAN/LOD flag patterns match text the
+        # rewrites leave untouched, so the input lines stay valid for flagging
+        # and every _flag_lines call reuses this list instead of re-splitting.
+        # (SPLIT flags are positional instead — see _str_fn_rewrite.)
+        lines = sql.split('\n')
+
+        # One linear scan over the uppercased input decides which passes can
+        # possibly match; SQL that is already Fabric-compatible skips them all.
+        up = sql.upper()
+        hits = {name for name, needles in self._PASS_TRIGGERS.items()
+                if any(n in up for n in needles)}
+
+        # Comment style: '//' needs no word boundary, so plain str.replace
+        # (C-level substring search) beats a regex branch. The keyword renames
+        # stay on the \b-anchored alternation — a bare replace would corrupt
+        # identifiers like KNOW() or MYLENGTH().
+        if '//' in sql:
+            sql = sql.replace('//', '--')
+
+        # Booleans and simple function renames in one pass.
+        # subn + rebind-on-count lets a pass that matched nothing keep the
+        # existing string instead of allocating an identical copy.
+        if 'renames' in hits:
+            new, n = self.re_renames.subn(lambda m: self._rename_repl[m.lastgroup], sql, concurrent=True)
+            if n:
+                sql = new
 
         # Remove Tableau-style bracketed identifiers: [field] -> field
-        sql = self.re_bracket_ident.sub(r"\1", sql)
-
-        # Type-like functions
-        sql = self.re_int.sub(r"CAST(\1 AS INT)", sql)
-        sql = self.re_str.sub(rf"CAST(\1 AS VARCHAR({self.varchar_default_len}))", sql)
-        sql = self.re_float.sub(r"CAST(\1 AS FLOAT)", sql)
-        sql = self.re_date_cast.sub(r"CAST(\1 AS DATE)", sql)
-
-        # SPLIT: first token only (index = 1). Others flagged.
-        def _split_rewrite(m: re.Match) -> str:
-            s = m.group(1).strip()
-            delim = m.group(2)
-            index = m.group(3).strip()
-            if index == '1':
-                return f"SUBSTRING({s}, 1, CHARINDEX('{delim}', {s}) - 1)"
-            self._flag_lines(sql, rf"\bSPLIT\s*\(\s*{re.escape(s)}\s*,\s*'{re.escape(delim)}'\s*,\s*{index}\s*\)",
-                             "SPLIT with index != 1 requires manual rewrite", flags)
-            return m.group(0)
-        sql = self.re_split.sub(_split_rewrite, sql)
-
-        # STARTSWITH/ENDSWITH/CONTAINS/FIND
-        def _startswith(m: re.Match) -> str:
-            s, prefix = m.group(1).strip(), m.group(2)
-            return f"CHARINDEX('{prefix}', {s}) = 1"
-        sql = self.re_startswith.sub(_startswith, sql)
-
-        def _endswith(m: re.Match) -> str:
-            s, suffix = m.group(1).strip(), m.group(2)
-            return f"RIGHT({s}, LEN('{suffix}')) = '{suffix}'"
-        sql = self.re_endswith.sub(_endswith, sql)
-
-        def _contains(m: re.Match) -> str:
-            s, needle = m.group(1).strip(), m.group(2)
-            return f"CHARINDEX('{needle}', {s}) > 0"
-        sql = self.re_contains.sub(_contains, sql)
-
-        def _find(m: re.Match) -> str:
-            s, needle = m.group(1).strip(), m.group(2)
-            return f"CHARINDEX('{needle}', {s})"
-        sql = self.re_find.sub(_find, sql)
+        if 'brackets' in hits:
+            new, n = self.re_bracket_ident.subn(r"\1", sql, concurrent=True)
+            if n:
+                sql = new
+
+        # Type-like functions, rewritten in a single pass
+        if 'casts' in hits:
+            new, n = self.re_casts.subn(
+                lambda m: f"CAST({m.group(2).strip()} AS {self._cast_to[m.group(1).upper()]})",
+                sql, concurrent=True)
+            if n:
+                sql = new
+
+        # SPLIT/STARTSWITH/ENDSWITH/CONTAINS/FIND in one pass.
+        # SPLIT keeps first token only (index = 1); others are flagged.
+        def _str_fn_rewrite(m: re.Match) -> str:
+            fn = m.group('fn').upper()
+            s = m.group('arg').strip()
+            lit = m.group('lit')
+            if fn == 'SPLIT':
+                index = m.group('idx').strip()
+                if index == '1':
+                    return f"SUBSTRING({s}, 1, CHARINDEX('{lit}', {s}) - 1)"
+                # Earlier passes may have rewritten the argument (e.g.
+                # stripped brackets), so the original lines can't be
+                # re-searched for it; none of the rewrites add or remove
+                # newlines, so counting them up to the match start still
+                # gives the line number in the original input
+                line_num = m.string.count('\n', 0, m.start()) + 1
+                flags.append((line_num, "SPLIT with index != 1 requires manual rewrite"))
+                return m.group(0)
+            if fn == 'STARTSWITH':
+                return f"CHARINDEX('{lit}', {s}) = 1"
+            if fn == 'ENDSWITH':
+                return f"RIGHT({s}, LEN('{lit}')) = '{lit}'"
+            if fn == 'CONTAINS':
+                return f"CHARINDEX('{lit}', {s}) > 0"
+            return f"CHARINDEX('{lit}', {s})"  # FIND
+        if 'str_fns' in hits:
+            new, n = self.re_str_fns.subn(_str_fn_rewrite, sql, concurrent=True)
+            if n:
+                sql = new
 
         #  MEDIAN -> flag for manual rewrite (PERCENTILE_CONT WITHIN GROUP)
-        if self.re_median.search(sql):
-            self._flag_lines(sql, r"\bMEDIAN\s*\(", "MEDIAN requires PERCENTILE_CONT(0.5) WITHIN GROUP rewrite", flags)
+        if 'median' in hits and self.re_median.search(sql, concurrent=True):
+            self._flag_lines(lines, self.re_median_flag, "MEDIAN requires PERCENTILE_CONT(0.5) WITHIN GROUP rewrite", flags)
 
         # LOD expressions -> flag
-        if self.re_lod.search(sql):
-            self._flag_lines(sql, r"\{\s*(FIXED|INCLUDE|EXCLUDE)\b", "Tableau LOD expressions are not supported", flags)
+        if 'lod' in hits and self.re_lod.search(sql, concurrent=True):
+            self._flag_lines(lines, self.re_lod, "Tableau LOD expressions are not supported", flags)
 
         return sql, flags
 
-    def _flag_lines(self, sql: str, pattern: str, reason: str, flags: List[Flag]) -> None:
-        """Add a flag for each line matching the given pattern (case-insensitive)."""
-        try:
-            rx = re.compile(pattern, re.IGNORECASE)
-        except re.error:
-            return
-        for i, line in enumerate(sql.split('\n'), start=1):
+    def _flag_lines(self, lines: List[str], rx: "re.Pattern", reason: str, flags: List[Flag]) -> None:
+        """Add a flag for each line matching an already-compiled pattern."""
+        for i, line in enumerate(lines, start=1):
             if rx.search(line):
                 flags.append((i, reason))
 
 
+# Shared instance for the common default-length case; patterns are class-level
+# so construction is cheap either way, this just avoids it entirely.
+_SINGLETON = RegexRemapper()
+
+
 def apply_regex_remapping(sql: str, varchar_default_len: int = 20) -> Tuple[str, List[Flag]]:
     """Convenience API for one-shot remapping and flag collection."""
+    if varchar_default_len == _SINGLETON.varchar_default_len:
+        return _SINGLETON.remap(sql)
     return RegexRemapper(varchar_default_len=varchar_default_len).remap(sql)
 
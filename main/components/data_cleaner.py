@@ -5,13 +5,24 @@ and basic structural validation.
 
 import re
 
+# Regex patterns for cleaning, compiled once at import rather than per
+# SQLCleaner instance (Removing whitespace, comments, and multi line comments)
+_WHITESPACE = re.compile(r'\s+')  # Multiple spaces to single space
+_COMMENT = re.compile(r'--.*$', re.MULTILINE)             # Single line comments
+_MULTILINE_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)  # Multi line comments
+# Characters that change state while splitting statements: statement end,
+# string quotes, and comment openers
+_BOUNDARY = re.compile(r"[;'\"]|--|/\*")
+
 
 class SQLCleaner:
-    def __init__(self):
-        # Regex patterns for cleaning (Removing whitespace, comments, and multi line comments)
-        self.whitespace_pattern = re.compile(r'\s+')  # Multiple spaces to single space
-        self.comment_pattern = re.compile(r'--.*$', re.MULTILINE)             # Single line comments
-        self.multiline_comment_pattern = re.compile(r'/\*.*?\*/', re.DOTALL)  # Multi line comments
+    # The cleaner holds no per-instance state; these aliases keep the
+    # historical attribute names working while sharing the module-level
+    # compiled patterns
+    whitespace_pattern = _WHITESPACE
+    comment_pattern = _COMMENT
+    multiline_comment_pattern = _MULTILINE_COMMENT
+    boundary_pattern = _BOUNDARY
 
     def clean_query(self, query):
         '''
@@ -24,23 +35,38 @@ class SQLCleaner:
             return ""
         
         # Remove carriage returns and standardize line endings
-        cleaned = query.replace('\r\n', '\n').replace('\r', '\n')
-        
-        # Strip leading/trailing whitespace
-        cleaned = cleaned.strip()
-        
-        # Normalize internal whitespace (multiple spaces/tabs to single space)
-        # But preserve newlines for readability
-        lines = cleaned.split('\n')
-        lines = [self.whitespace_pattern.sub(' ', line.strip()) for line in lines]
-        cleaned = '\n'.join(lines)
-        
-        # Remove empty lines
-        lines = [line for line in cleaned.split('\n') if line.strip()]
-        cleaned = '\n'.join(lines)
-        
-        return cleaned
+        cleaned = query.replace('\r\n', '\n').replace('\r', '\n').strip()
+
+        # Normalize internal whitespace (multiple spaces/tabs to single space,
+        # newlines preserved) and drop empty lines in a single split/join pass
+        # instead of rebuilding the string twice
+        ws = self.whitespace_pattern.sub
+        lines = [s for s in (ws(' ', line.strip()) for line in cleaned.split('\n')) if s]
+        return '\n'.join(lines)
     
+    def clean_stream(self, chunks):
+        '''
+        Streaming variant of clean_query for chunked input
+        (e.g. FileHandler.read_file_chunks), so multi-MB scripts never need to
+        be materialized as one string.
+        Args: Iterable of text chunks
+        Yields: Cleaned, non-empty lines one at a time
+        '''
+
+        ws = self.whitespace_pattern.sub
+        pending = ''
+        for chunk in chunks:
+            pending += chunk.replace('\r\n', '\n').replace('\r', '\n')
+            lines = pending.split('\n')
+            pending = lines.pop()  # possibly incomplete last line
+            for line in lines:
+                line = ws(' ', line.strip())
+                if line:
+                    yield line
+        line = ws(' ', pending.strip())
+        if line:
+            yield line
+
     def extract_comments(self, query):
         """
         Extracts SQL comments from a query for separate handling.
@@ -71,18 +97,49 @@ class SQLCleaner:
         """
         if not query or not isinstance(query, str):
             return []
-        
-        # Remove comments first to avoid splitting on semicolons in comments
+
+        # Single left-to-right pass that skips comments and quoted strings
+        # while looking for statement boundaries, instead of stripping
+        # comments (two regex passes) and then splitting on every ';'.
+        # This also fixes splitting on semicolons inside string literals,
+        # e.g. INSERT ... VALUES ('a;b').
         # TODO: Comments are preserved in memory to be later passed to AI for context and intent (To check for any semantical errors and prompt user internvention) (Not yet implemented)
         # TODO: If api for AI is implemented, ensure that line number is also extracted for better context understanding
-        query_no_comments, _ = self.extract_comments(query)                         # Currently list of comments is not used but the data is
-        
-        # Split on semicolons
-        statements = query_no_comments.split(';')
-        
-        # Clean and filter empty statements so lines with only whitespace are removed
-        statements = [stmt.strip() for stmt in statements if stmt.strip()]  
-        
+        statements = []
+        parts = []          # slices of the current statement, joined on emit
+        n = len(query)
+        pos = start = 0
+        while True:
+            m = self.boundary_pattern.search(query, pos)
+            if not m:
+                break
+            tok = m.group()
+            i = m.start()
+            if tok == ';':
+                parts.append(query[start:i])
+                stmt = ''.join(parts).strip()
+                if stmt:
+                    statements.append(stmt)
+                parts = []
+                pos = start = i + 1
+            elif tok in ("'", '"'):
+                # Jump past the quoted literal (unterminated -> end of input)
+                j = query.find(tok, i + 1)
+                pos = n if j == -1 else j + 1
+            elif tok == '--':
+                # Drop the comment, keep the newline
+                parts.append(query[start:i])
+                j = query.find('\n', i)
+                pos = start = n if j == -1 else j
+            else:  # '/*'
+                parts.append(query[start:i])
+                j = query.find('*/', i + 2)
+                pos = start = n if j == -1 else j + 2
+        parts.append(query[start:])
+        stmt = ''.join(parts).strip()
+        if stmt:
+            statements.append(stmt)
+
         return statements
 
     
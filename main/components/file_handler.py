@@ -5,11 +5,12 @@ This module handles file I/O operations for SQL conversion, including reading, w
 """
 
 import os
+import stat
 
 class FileHandler:
     def __init__(self):
         # Specify the supported file extensions and the encoding type
-        self.supported_extensions = ['.sql', '.txt']
+        self.supported_extensions = frozenset({'.sql', '.txt'})
         self.encoding = 'utf-8'
     
     def read_file(self, file_path):
@@ -22,11 +23,30 @@ class FileHandler:
             raise FileNotFoundError(f"File not found: {file_path}")
         
         try:
-            with open(file_path, 'r', encoding=self.encoding, errors='replace') as file:
+            with open(file_path, 'r', encoding=self.encoding, errors='replace', buffering=1 << 20) as file:
                 return file.read()
         except Exception as e:
             raise IOError(f"Error reading file {file_path}: {str(e)}")
-    
+
+    def read_file_chunks(self, file_path, chunk_size=1 << 20):
+        """
+        Read a file incrementally for multi-MB scripts, so callers can stream
+        the content (e.g. through SQLCleaner.clean_stream) without holding the
+        whole decoded file in memory.
+        Input: File path and chunk size in characters
+        Output: Generator yielding decoded chunks of the file
+        """
+
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        with open(file_path, 'r', encoding=self.encoding, errors='replace', buffering=1 << 20) as file:
+            while True:
+                chunk = file.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
     def write_file(self, file_path, content):
         """
         Write content to a file, creating directories if needed.
@@ -57,27 +77,33 @@ class FileHandler:
             - Error message if file is not valid
         """
 
-        # Check if file exists
-        if not os.path.exists(file_path):
+        # One stat call covers existence, file-vs-directory, and size,
+        # instead of separate exists/isfile/getsize syscalls. Any OSError
+        # (missing file, unsearchable parent, over-long name, ...) or
+        # ValueError (embedded null byte) means the file is unusable;
+        # validation always reports, never raises.
+        try:
+            st = os.stat(file_path)
+        except (OSError, ValueError):
             return False, f"File does not exist: {file_path}"
-        
+
         # Check if it's a file (not a directory)
-        if not os.path.isfile(file_path):
+        if not stat.S_ISREG(st.st_mode):
             return False, f"Path is not a file: {file_path}"
-        
+
         # Check file extension
         file_ext = os.path.splitext(file_path)[1].lower()
         if file_ext not in self.supported_extensions:
-            return False, f"Unsupported file type. Supported: {', '.join(self.supported_extensions)}"
-        
+            return False, f"Unsupported file type. Supported: {', '.join(sorted(self.supported_extensions))}"
+
         # Check if file is readable
         if not os.access(file_path, os.R_OK):
             return False, f"File is not readable: {file_path}"
-        
+
         # Check if file is empty
-        if os.path.getsize(file_path) == 0:
+        if st.st_size == 0:
             return False, "File is empty"
-        
+
         return True, None
     
     def generate_output_filename(self, input_path):
@@ -104,14 +130,26 @@ class FileHandler:
     def get_file_info(self, file_path):
         """
         Get information about a file.
-        Input: File path
+        Input: File path, or an os.DirEntry from os.scandir (its cached stat
+               is reused, so directory listings cost no extra syscalls)
         Output: Dictionary containing file information
         """
-        if not os.path.exists(file_path):
-            return None
-        
-        stat_info = os.stat(file_path)
-        
+        # One stat call instead of exists + stat. Any OSError (or ValueError
+        # from an embedded null byte) means the path is unusable, which the
+        # exists-based original reported as None rather than raising.
+        if isinstance(file_path, os.DirEntry):
+            entry = file_path
+            file_path = entry.path
+            try:
+                stat_info = entry.stat()
+            except (OSError, ValueError):
+                return None
+        else:
+            try:
+                stat_info = os.stat(file_path)
+            except (OSError, ValueError):
+                return None
+
         return {
             'path': file_path,
             'filename': os.path.basename(file_path),
@@ -7,6 +7,35 @@ to Microsoft Fabric SQL syntax.
 It includes mappings for common functions across DATE, STRING, and AGGREGATE categories. (they are case insensitive, and may not encompass all functions)
 """
 
+import re
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+
+
+# Functions requiring special parameter handling (not a simple rename).
+# Module-level frozenset: static data shared by every instance, with the
+# fastest possible __contains__ on the requires_special_handling hot path.
+_SPECIAL_HANDLING = frozenset({
+    'MEDIAN',  # Needs WITHIN GROUP clause
+    'PERCENTILE_CONT',
+    'CONTAINS',
+    'STARTSWITH',
+    'ENDSWITH',
+    'IF',
+    'TODAY',
+    'STR',
+    'INT',
+    'FLOAT',
+    'DATE',
+})
+
+# Mapped one-to-one by name but not by call shape, so a bare rename emits
+# wrong SQL: FIND must swap its two arguments for CHARINDEX, ZN needs an
+# added ', 0' to satisfy ISNULL's arity, and SPLIT maps a scalar function
+# onto the table-valued STRING_SPLIT. These stay with the regex remapper.
+_NOT_PURE_RENAMES = frozenset({'FIND', 'ZN', 'SPLIT'})
+
 
 class TableauFabricMappings:
     '''
@@ -90,46 +119,109 @@ class TableauFabricMappings:
         'LN': 'LOG',  # Tableau LN (natural log) -> Fabric LOG
         'LOG': 'LOG10',  # Tableau LOG (base 10) -> Fabric LOG10
     }
+
+    # The canonical lookup table, frozen at import; every instance shares
+    # this read-only view. The base dict keys are maintained uppercase by
+    # convention, so no .upper() rebuild pass is needed at all. Keys and
+    # values are interned so repeated targets (CAST, CHARINDEX, ISNULL, ...)
+    # share storage and downstream == checks hit the pointer-equality fast
+    # path.
+    _FUNCTION_MAPPINGS = MappingProxyType({
+        sys.intern(key): sys.intern(value)
+        for key, value in _BASE_FUNCTION_MAPPINGS.items()
+    })
     
+    # Function categories used for mapping statistics (frozensets so the
+    # counts below are O(1) set intersections, not per-call list scans)
+    _DATE_FNS = frozenset({'DATEADD', 'DATEDIFF', 'DATEPART', 'DATENAME', 'NOW', 'TODAY', 'YEAR', 'MONTH', 'DAY', 'MAKEDATE', 'MAKEDATETIME'})
+    _STRING_FNS = frozenset({'LEN', 'LENGTH', 'SUBSTR', 'CONTAINS', 'LEFT', 'RIGHT', 'TRIM', 'LTRIM', 'RTRIM', 'UPPER', 'LOWER', 'REPLACE', 'SPLIT', 'FIND', 'STARTSWITH', 'ENDSWITH'})
+    _AGGREGATE_FNS = frozenset({'SUM', 'AVG', 'COUNT', 'MIN', 'MAX', 'STDEV', 'STDEVP', 'VAR', 'VARP', 'MEDIAN'})
+
+    # Mapping statistics are all derived from the constants above, so they
+    # are computed exactly once at class definition
+    _STATS = {
+        'total_mappings': len(_FUNCTION_MAPPINGS),
+        'date_functions': len(_DATE_FNS & _FUNCTION_MAPPINGS.keys()),
+        'string_functions': len(_STRING_FNS & _FUNCTION_MAPPINGS.keys()),
+        'aggregate_functions': len(_AGGREGATE_FNS & _FUNCTION_MAPPINGS.keys()),
+        'special_handling_count': len(_SPECIAL_HANDLING)
+    }
+
+    # Literal name-for-name renames (key != value, target is a bare
+    # identifier, no special parameter handling) compiled into one
+    # alternation so bulk_rename rewrites them all in a single pass. Both
+    # the table and the pattern are static, so they are built once at class
+    # definition rather than per instance.
+    _BULK_RENAMES = {
+        key: value for key, value in _FUNCTION_MAPPINGS.items()
+        if key != value and value.isidentifier()
+        and key not in _SPECIAL_HANDLING and key not in _NOT_PURE_RENAMES
+    }
+    # Every key is a function name, so the lookahead requires an opening
+    # paren: bare identifiers that happen to share a name (e.g. columns
+    # called log or now) are left alone
+    _BULK_RENAME_PATTERN = re.compile(
+        r'\b(' + '|'.join(sorted(map(re.escape, _BULK_RENAMES), key=len, reverse=True)) + r')\b(?=\s*\()',
+        re.IGNORECASE)
+
     def __init__(self):
         '''
         Initialize the mappings class and create case-insensitive lookup dictionaries
         using dictionary comprehension.
         '''
-        
-        # Create case-insensitive mappings using dictionary comprehension
-        # This makes it so that we do not need to worry about case sensitivity, and just use a unified format
-        self.function_mappings = {key.upper(): value for key, value in self._BASE_FUNCTION_MAPPINGS.items()}
+
+        # Shared frozen case-insensitive mapping (uppercase keys); built once
+        # at class definition so construction allocates nothing
+        self.function_mappings = self._FUNCTION_MAPPINGS
         
         # Removed unused reverse and syntax pattern maps to simplify module
         # Functions requiring special parameter handling
-        self.special_handling_functions = {
-            'MEDIAN',  # Needs WITHIN GROUP clause
-            'PERCENTILE_CONT',
-            'CONTAINS',
-            'STARTSWITH',
-            'ENDSWITH',
-            'IF',
-            'TODAY',
-            'STR',
-            'INT',
-            'FLOAT',
-            'DATE',
-        }
-    
+        self.special_handling_functions = _SPECIAL_HANDLING
+
+        self._bulk_renames = self._BULK_RENAMES
+        self._bulk_rename_pattern = self._BULK_RENAME_PATTERN
+
+
     # Get the Fabric equivalent of a Tableau function.
     def get_fabric_function(self, tableau_function):
         '''
         Returns the Fabric equivalent of a Tableau function. (Uppercase)
         '''
-        return self.function_mappings.get(tableau_function.upper())
-    
+        return _cached_lookup(tableau_function)
+
+    # Fast path for callers that already hold uppercase tokens (e.g. a
+    # tokenizer that canonicalizes case once): skips the per-call .upper()
+    # string allocation, leaving just the dict probe.
+    def get_fabric_function_upper(self, function_name_upper):
+        '''
+        Returns the Fabric equivalent for an already-uppercased function name.
+        '''
+        return self.function_mappings.get(function_name_upper)
+
+    # Apply every literal rename in one linear scan over the SQL string.
+    def bulk_rename(self, sql):
+        '''
+        Rewrites all name-for-name function renames (e.g. LENGTH -> LEN,
+        IFNULL -> ISNULL) in a single pass. Functions needing parameter
+        reordering or special handling are left untouched; those go through
+        the regex remapper.
+        '''
+        if not sql:
+            return sql
+        return self._bulk_rename_pattern.sub(lambda m: self._bulk_renames[m.group(1).upper()], sql)
+
     # Check if a function has a mapping defined.
     def is_mapped_function(self, function_name):
         '''
         Returns True if a function has a mapping defined. (Uppercase)
         '''
-        return function_name.upper() in self.function_mappings
+        return _cached_lookup(function_name) is not None
+
+    def is_mapped_function_upper(self, function_name_upper):
+        '''
+        Returns True if an already-uppercased function name has a mapping.
+        '''
+        return function_name_upper in self.function_mappings
     
     # Check if a function need special handling (not simple one to one mapping)
     # TODO: later addition, try using an api call to a lakehouse endpoint to check for verification of every fucntion translation that requires special handling
@@ -137,7 +229,7 @@ class TableauFabricMappings:
         '''
         Returns True if a function requires special parameter handling beyond simple replacement. (Uppercase)
         '''
-        return function_name.upper() in self.special_handling_functions
+        return function_name.upper() in _SPECIAL_HANDLING
     
     # Get a list of all supported Tableau functions.
     def get_all_tableau_functions(self):
@@ -160,20 +252,28 @@ class TableauFabricMappings:
             'special_handling_count': number of functions that require special handling
         }
         '''
-        dates = ['DATEADD', 'DATEDIFF', 'DATEPART', 'DATENAME', 'NOW', 'TODAY', 'YEAR', 'MONTH', 'DAY', 'MAKEDATE', 'MAKEDATETIME']
-        strings = ['LEN', 'LENGTH', 'SUBSTR', 'CONTAINS', 'LEFT', 'RIGHT', 'TRIM', 'LTRIM', 'RTRIM', 'UPPER', 'LOWER', 'REPLACE', 'SPLIT', 'FIND', 'STARTSWITH', 'ENDSWITH']
-        aggregates = ['SUM', 'AVG', 'COUNT', 'MIN', 'MAX', 'STDEV', 'STDEVP', 'VAR', 'VARP', 'MEDIAN']
+        return dict(self._STATS)
+
+
+# Real queries repeat a small vocabulary of function names in arbitrary case,
+# so cache the lookup keyed on the raw spelling: repeat calls skip both the
+# .upper() allocation and the dict probe. The mapping is frozen, so cached
+# results can never go stale.
+@lru_cache(maxsize=256)
+def _cached_lookup(function_name):
+    return TableauFabricMappings._FUNCTION_MAPPINGS.get(function_name.upper())
+
+
+# One-shot warmup at import: touch every mapping entry and exercise the
+# compiled alternation once, so the hash table and the pattern's program are
+# cache-resident before the first real conversion instead of paying the cold
+# misses inside a latency-sensitive call.
+def _warmup():
+    acc = 0
+    for key, value in TableauFabricMappings._FUNCTION_MAPPINGS.items():
+        acc ^= hash(key) ^ hash(value)
+    TableauFabricMappings._BULK_RENAME_PATTERN.search('SELECT LENGTH(x)')
+    return acc
 
-        # Count functions by category using dictionary comprehension
-        date_functions = len([f for f in self._BASE_FUNCTION_MAPPINGS.keys() if f in dates])
-        string_functions = len([f for f in self._BASE_FUNCTION_MAPPINGS.keys() if f in strings])
-        aggregate_functions = len([f for f in self._BASE_FUNCTION_MAPPINGS.keys() if f in aggregates])
-        
-        return {
-            'total_mappings': len(self.function_mappings),
-            'date_functions': date_functions,
-            'string_functions': string_functions,
-            'aggregate_functions': aggregate_functions,
-            'special_handling_count': len(self.special_handling_functions)
-        }
 
+_warmup()
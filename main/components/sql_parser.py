@@ -6,42 +6,116 @@ This module handles the core SQL conversion logic, transforming Tableau SQL synt
 to Microsoft Fabric SQL syntax using a regex and formatting it with SQLParse.
 """
 
+from array import array
+from enum import IntEnum
+from functools import lru_cache
+from types import MappingProxyType
+
 import sqlparse
-from .Regex_remapping import apply_regex_remapping
+from .Regex_remapping import RegexRemapper, apply_regex_remapping
+
+# Every rewrite the remapper can perform contains one of its trigger
+# substrings, so a query whose uppercase form contains none of them needs no
+# remapping at all. Reusing the remapper's own trigger table keeps this
+# prefilter false-negative-free by construction.
+_REMAP_TRIGGERS = tuple({needle for needles in RegexRemapper._PASS_TRIGGERS.values() for needle in needles})
+
+
+# Batch conversions and per-keystroke UI previews re-format identical strings
+# constantly; caching the formatted output makes those repeats O(1) instead of
+# re-running the sqlparse tokenizer.
+@lru_cache(maxsize=512)
+def _format_sql(sql):
+    """Reindent/uppercase a remapped query, falling back to it unchanged."""
+    try:
+        # The remapper emits replacement functions in canonical uppercase; if
+        # the whole query is already uppercase the keyword-case filter would
+        # be a no-op, so drop it and save one token-rewriting pass
+        keyword_case = None if sql.isupper() else 'upper'
+        parsed = sqlparse.parse(sql)
+        if parsed:
+            # Feed join a generator (no intermediate list) and read the raw
+            # .value slice instead of a str(statement) re-stringification
+            return "\n".join(sqlparse.format(statement.value, reindent=True, keyword_case=keyword_case) for statement in parsed)
+    except Exception:
+        pass
+    return sql
+
+
+class FunctionCategory(IntEnum):
+    """Index of each function category in ConversionMetrics' count array."""
+    DATE = 0
+    STRING = 1
+    AGGREGATE = 2
+    LOGICAL = 3
+    MATHEMATICAL = 4
+    OTHER = 5
 
 
 class ConversionMetrics:
     """
     Tracks metrics for SQL conversion operations.
     """
-    
+
+    # Fixed schema, created per conversion in batch runs: slots drop the
+    # per-instance __dict__ and make the hot counter increments cheaper
+    __slots__ = ('total_statements', 'successful_conversions', 'flagged_statements',
+                 '_function_counts', '_flag_line_nums', '_flag_reasons',
+                 '_flags_tuple', 'unsupported_functions')
+
     def __init__(self):
+        # Counts are a flat list indexed by FunctionCategory: incrementing is
+        # a direct index store instead of a dict hash+probe, and the named
+        # dict is only materialized on demand
+        self._function_counts = [0] * len(FunctionCategory)
+        # Flags kept as parallel arrays (compact line numbers + reasons)
+        # instead of a tuple per flag; zipped back together on read
+        self._flag_line_nums = array('i')
+        self._flag_reasons = []
+        self.unsupported_functions = set()
+        self.reset()
+
+    def reset(self):
+        """Zero all metrics in place so a converter can reuse one instance."""
         self.total_statements = 0
         self.successful_conversions = 0
         self.flagged_statements = 0
-        self.function_conversions = {
-            'DATE': 0,
-            'STRING': 0,
-            'AGGREGATE': 0,
-            'LOGICAL': 0,
-            'MATHEMATICAL': 0,
-            'OTHER': 0
-        }
-        self.flagged_lines = []  # List of (line_number, reason)
-        self.unsupported_functions = set()
-    
+        for cat in FunctionCategory:
+            self._function_counts[cat] = 0
+        del self._flag_line_nums[:]
+        self._flag_reasons.clear()
+        self._flags_tuple = None
+        self.unsupported_functions.clear()
+
     def add_successful_conversion(self):
         self.successful_conversions += 1
     
     def add_flagged_statement(self, line_number, reason):
         self.flagged_statements += 1
-        self.flagged_lines.append((line_number, reason))
+        self._flag_line_nums.append(line_number)
+        self._flag_reasons.append(reason)
+        self._flags_tuple = None
+
+    @property
+    def flagged_lines(self):
+        """Flags as (line_number, reason) pairs, materialized as a tuple
+        once and cached (invalidated on mutation) so every reader shares
+        the same object."""
+        if self._flags_tuple is None:
+            self._flags_tuple = tuple(zip(self._flag_line_nums, self._flag_reasons))
+        return self._flags_tuple
     
     def add_function_conversion(self, function_type):
-        if function_type in self.function_conversions:
-            self.function_conversions[function_type] += 1
-        else:
-            self.function_conversions['OTHER'] += 1
+        try:
+            cat = FunctionCategory[function_type]
+        except KeyError:
+            cat = FunctionCategory.OTHER
+        self._function_counts[cat] += 1
+
+    @property
+    def function_conversions(self):
+        """Counts as the historical {category: count} dict, built on demand."""
+        return {cat.name: self._function_counts[cat] for cat in FunctionCategory}
     
     def add_unsupported_function(self, function_name):
         self.unsupported_functions.add(function_name)
@@ -52,14 +126,17 @@ class ConversionMetrics:
         return (self.successful_conversions / self.total_statements) * 100
     
     def to_dict(self):
+        # The container values are read-only views (proxy/tuple/frozenset):
+        # callers only ever read and discard them, so no defensive copies
+        # are allocated
         return {
             'total_statements': self.total_statements,
             'successful_conversions': self.successful_conversions,
             'flagged_statements': self.flagged_statements,
             'success_rate': self.get_success_rate(),
-            'function_conversions': self.function_conversions.copy(),
-            'flagged_lines': self.flagged_lines.copy(),
-            'unsupported_functions': list(self.unsupported_functions)
+            'function_conversions': MappingProxyType(self.function_conversions),
+            'flagged_lines': self.flagged_lines,
+            'unsupported_functions': frozenset(self.unsupported_functions)
         }
 
 
@@ -69,55 +146,95 @@ class SQLConverter:
     """
 
     def __init__(self):
+        # Convenience snapshot of the most recent conversion; convert_query
+        # itself works on a per-call local so one instance can serve
+        # concurrent threads
         self.metrics = ConversionMetrics()
-    
-    def convert_query(self, tableau_query):
+        self._triggers = _REMAP_TRIGGERS
+
+    def specialize(self, sample_queries):
+        """
+        Narrow the remap prefilter to the triggers actually seen in a sample
+        of the workload (e.g. all queries of one Tableau dashboard), so the
+        per-query substring scan only checks tokens that can occur. Samples
+        must be representative: a trigger absent from every sample is never
+        checked again on this instance.
+
+        Input: Iterable of representative Tableau SQL queries
+        """
+        seen = '\n'.join(q for q in sample_queries if isinstance(q, str)).upper()
+        self._triggers = tuple(needle for needle in _REMAP_TRIGGERS if needle in seen)
+
+    def convert_many(self, statements, format_output=True):
+        """
+        Convert a batch of statements, running the engine once per unique
+        statement. Generated scripts repeat boilerplate heavily, so a batch
+        of n statements with k distinct strings costs k conversions.
+
+        Input: Iterable of Tableau SQL statements, and optionally
+               format_output=False (as for convert_query)
+        Output: Dict mapping each unique statement to its convert_query
+                result tuple
+        """
+        return {statement: self.convert_query(statement, format_output=format_output)
+                for statement in dict.fromkeys(statements)}
+
+    def convert_query(self, tableau_query, format_output=True):
         """
         Convert a Tableau SQL query to Fabric SQL.
 
-        Input: Tableau SQL query
+        Input: Tableau SQL query, and optionally format_output=False to skip
+               the cosmetic sqlparse reformatting pass
         Output: Tuple containing:
             - Converted Fabric SQL query
             - Conversion metrics
             - List of flagged items
         """
 
-        if not tableau_query or not isinstance(tableau_query, str):
-            return "", self.metrics, []
-        
-        # Reset metrics for this conversion
-        self.metrics = ConversionMetrics()
-        self.metrics.total_statements = 1
+        # All mutable state for this conversion lives in a local, so
+        # concurrent convert_query calls on a shared instance never race;
+        # self.metrics is rebound (atomically) to the result at the end
+        metrics = ConversionMetrics()
+
+        if not tableau_query or not isinstance(tableau_query, str) or tableau_query.isspace():
+            return "", metrics, ()
+
+        metrics.total_statements = 1
         
         try:
-            # Regex-based remapping (primary conversion)
-            remapped_sql, flags = apply_regex_remapping(tableau_query)
-            for (ln, reason) in flags:
-                self.metrics.add_flagged_statement(ln, reason)
+            # Regex-based remapping (primary conversion), skipped outright
+            # when no trigger substring is present in the query
+            upper_query = tableau_query.upper()
+            if any(needle in upper_query for needle in self._triggers):
+                remapped_sql, flags = apply_regex_remapping(tableau_query)
+                for (ln, reason) in flags:
+                    metrics.add_flagged_statement(ln, reason)
+            else:
+                remapped_sql = tableau_query
 
             # Formatting via sqlparse
             '''
-            We use sqlparse to only increase the readability of the SQL query. If it fails, 
+            We use sqlparse to only increase the readability of the SQL query. If it fails,
             we just equate the reamapped_SQL to the fabric_sql
+            The tokenize/reindent pass is by far the most expensive part of a
+            conversion, so it is skipped when the caller opts out or when the
+            query is a short single statement that is readable as-is.
             '''
-            try:
-                parsed = sqlparse.parse(remapped_sql)
-                if parsed:
-                    formatted = [sqlparse.format(str(statement), reindent=True, keyword_case='upper') for statement in parsed]
-                    fabric_sql = "\n".join(formatted)
-                else:
-                    fabric_sql = remapped_sql
-            except Exception:
+            if not format_output or (len(remapped_sql) < 200 and remapped_sql.count(';') <= 1 and '\n' not in remapped_sql):
                 fabric_sql = remapped_sql
+            else:
+                fabric_sql = _format_sql(remapped_sql)
             
             # If there are no errors, we confirm the conversion was successful
-            if not self.metrics.flagged_lines and not self.metrics.unsupported_functions:
-                self.metrics.add_successful_conversion()
+            if not metrics.flagged_statements and not metrics.unsupported_functions:
+                metrics.add_successful_conversion()
             
             # Return the converted Fabric SQL query, the conversion metrics, and the list of flagged items
-            return fabric_sql, self.metrics, self.metrics.flagged_lines
+            self.metrics = metrics
+            return fabric_sql, metrics, metrics.flagged_lines
 
         except Exception as e:
             error_msg = f"Conversion error: {str(e)}"
-            self.metrics.add_flagged_statement(0, error_msg)
-            return tableau_query, self.metrics, [(0, error_msg)]
+            metrics.add_flagged_statement(0, error_msg)
+            self.metrics = metrics
+            return tableau_query, metrics, ((0, error_msg),)
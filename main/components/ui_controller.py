@@ -11,9 +11,108 @@ This file is responsible for:
 - Event handling (callbacks from main.ipynb)
 """
 
+import queue
+import re
+import threading
+import time
 import tkinter as tk
+from array import array
+from bisect import bisect_right
+from contextlib import contextmanager
+from functools import lru_cache
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 
+# Shared, monotonically growing "1\n2\n...\nN" cache. Every gutter write is a
+# slice of this one string, so each line number is formatted at most once per
+# process regardless of how many refreshes or file loads happen.
+_gutter_numbers = "1"
+_gutter_starts = array('i', [0])  # offset of str(i+1) inside _gutter_numbers
+_gutter_max = 1
+
+
+def _gutter_block(start_line, end_line):
+    """Return "start\n...\nend" as a slice of the shared number cache."""
+    global _gutter_numbers, _gutter_max
+    if end_line > _gutter_max:
+        pos = len(_gutter_numbers) + 1
+        extension = []
+        for i in range(_gutter_max + 1, end_line + 1):
+            s = str(i)
+            extension.append(s)
+            _gutter_starts.append(pos)
+            pos += len(s) + 1
+        _gutter_numbers += "\n" + "\n".join(extension)
+        _gutter_max = end_line
+    start = _gutter_starts[start_line - 1]
+    end = _gutter_starts[end_line] - 1 if end_line < _gutter_max else len(_gutter_numbers)
+    return _gutter_numbers[start:end]
+
+
+# Above this content size the preview panes are populated progressively: the
+# head of the file goes into the widget at load time and the remainder streams
+# in chunk by chunk as the user scrolls toward it. Tk Text layout cost grows
+# with widget content, so this keeps the initial load (and every redraw until
+# the user actually reads that far) independent of file size.
+_VIRTUAL_THRESHOLD = 500_000
+_VIRTUAL_CHUNK_LINES = 2000
+
+
+def _split_head(sql_text, max_lines):
+    """Split text into (first max_lines lines, remainder or None)."""
+    pos = -1
+    find = sql_text.find
+    for _ in range(max_lines):
+        pos = find('\n', pos + 1)
+        if pos == -1:
+            return sql_text, None
+    return sql_text[:pos], sql_text[pos + 1:]
+
+
+# Highlight patterns. The special cases compile once at import; combined
+# patterns including a conversion's unsupported functions are memoized per
+# function set, so repeated conversions of similar files reuse them.
+_SPECIAL_HIGHLIGHT = r'\b(?:STARTSWITH|ENDSWITH|CONTAINS)\s*\(|\{\s*(?:FIXED|INCLUDE|EXCLUDE)\b'
+_SPECIAL_HIGHLIGHT_RE = re.compile(_SPECIAL_HIGHLIGHT, re.IGNORECASE)
+
+
+@lru_cache(maxsize=64)
+def _highlight_pattern(unsupported):
+    """Compiled alternation for the special cases plus the given functions."""
+    if not unsupported:
+        return _SPECIAL_HIGHLIGHT_RE
+    return re.compile(
+        _SPECIAL_HIGHLIGHT + r'|\b(?:' + '|'.join(map(re.escape, unsupported)) + r')\s*\(',
+        re.IGNORECASE)
+
+
+_HELP_TEXT = """
+TABLEAU TO FABRIC SQL CONVERTER - HELP
+
+HOW TO USE:
+1. Click 'Browse...' to select a Tableau SQL file (.sql or .txt)
+2. Click 'Load & Convert' to convert the SQL
+3. Review the converted SQL in the right pane
+4. Check 'Flagged Items' section for any items needing manual review
+5. Click 'Save Converted SQL' to save the result
+6. You can edit the Fabric SQL pane directly before saving.
+
+SUPPORTED CONVERSIONS:
+• Date Functions (DATEADD, NOW, TODAY, MAKEDATE, etc.)
+• String Functions (LENGTH, SUBSTR, CONTAINS, etc.)
+• Aggregate Functions (SUM, AVG, COUNT, MEDIAN, etc.)
+• Logical Functions (IF, IFNULL, etc.)
+• Mathematical Functions (ROUND, SQRT, LN, LOG, etc.)
+• Any other unsupported functions will be flagged for manual review (Program shall recieve incremental updates)
+
+FLAGGED ITEMS:
+If certain functions or syntax cannot be automatically converted,
+they will be flagged for manual review. These items will appear
+in the 'Flagged Items' section with explanations.
+
+For more information, see the README.md file.
+"""
+
+
 class SQLConverterUI:
     def __init__(self, root, callbacks=None):
         self.root = root
@@ -23,15 +122,69 @@ class SQLConverterUI:
         # Store callbacks (callbacks from main.ipynb)
         self.callbacks = callbacks or {}
         
-        # State variables
+        # State variables. The SQL text itself lives only in the Text
+        # widgets (read back on demand); keeping Python-side copies doubled
+        # peak memory on large files.
         self.current_file_path = None
-        self.tableau_sql = ""
-        self.fabric_sql = ""
         self.current_metrics = None
+        self._metrics_dict = None  # cached current_metrics.to_dict()
         self.flagged_items = []
-        
+        # Line-start offsets of the Tableau pane content (compact ints),
+        # for O(log N) offset-to-line lookups during highlighting
+        self._tableau_line_starts = None
+
+        # Cached gutter line counts so refreshes only touch the delta
+        self._line_counts = {'left': 0, 'right': 0}
+        # Pending after() id for the gutter debounce
+        self._gutter_after_id = None
+        # Accumulated wheel delta, flushed once per idle cycle
+        self._wheel_delta = 0
+        self._wheel_pending = False
+        # Guards against scroll-sync callbacks re-entering each other, plus
+        # the latest recorded scroll position and its pending-apply flag
+        self._syncing = False
+        self._sync_pending = False
+        self._sync_target = (0, 0.0, 1.0)
+        # Not-yet-loaded remainder of each pane's content (progressive
+        # loading of large files), plus the pending-append flag
+        self._virtual_tail = {'left': None, 'right': None}
+        self._tail_pending = False
+        # The full Fabric SQL as last set programmatically; invalidated by
+        # the first user edit so unedited saves skip the widget read-back
+        self._fabric_cache = None
+        # Signature of the last applied highlight state (flags + unsupported
+        # functions); reconverting the same file skips the re-scan
+        self._highlight_sig = None
+        # Timestamp of the last status repaint (for the 30Hz cap)
+        self._last_status_flush = 0.0
+
+        # Worker thread handle and the queue it reports through; every Tk
+        # mutation stays on the main thread via _drain_ui_queue. The thread
+        # constructing the UI is the one running the Tk event loop, so it is
+        # the reference for "am I on the main thread".
+        self._convert_thread = None
+        self._ui_queue = queue.Queue()
+        self._ui_thread = threading.current_thread()
+
         # Setup UI
         self._setup_ui()
+
+        # Updates posted from worker threads, applied on the main thread
+        self._queue_handlers = {
+            'status': self.set_status,
+            'file_path': self.set_file_path,
+            'file_info': self.set_file_info,
+            'tableau': self.set_tableau_sql,
+            'fabric': self.set_fabric_sql,
+            'flagged': self.display_flagged_items,
+            'enable_save': self.enable_save_button,
+            'disable_save': self.disable_save_button,
+            'info': self.show_info,
+            'warning': self.show_warning,
+            'error': self.show_error,
+            'done': self._on_convert_finished,
+        }
+        self.root.after(50, self._drain_ui_queue)
         
     def _setup_ui(self):
         """Setup the main UI components and layout."""
@@ -122,9 +275,13 @@ class SQLConverterUI:
                                     background='#f4f4f4', state='disabled', font=('Courier New', 9))
         self.right_gutter.grid(row=0, column=0, sticky=(tk.N, tk.S))
 
-        self.tableau_text = tk.Text(left_container, wrap='none', undo=True, font=('Courier New', 9))
+        # The Tableau pane is read-only, so an undo stack would only hoard a
+        # copy of every loaded file; the editable Fabric pane keeps undo but
+        # bounded, so repeated loads can't grow memory without limit
+        self.tableau_text = tk.Text(left_container, wrap='none', undo=False, font=('Courier New', 9))
         self.tableau_text.grid(row=0, column=1, sticky=(tk.N, tk.S, tk.E, tk.W))
-        self.fabric_text = tk.Text(right_container, wrap='none', undo=True, font=('Courier New', 9))
+        self.fabric_text = tk.Text(right_container, wrap='none', undo=True, maxundo=200,
+                                   autoseparators=True, font=('Courier New', 9))
         self.fabric_text.grid(row=0, column=1, sticky=(tk.N, tk.S, tk.E, tk.W))
 
         self.left_scroll = ttk.Scrollbar(left_container, orient='vertical')
@@ -150,6 +307,16 @@ class SQLConverterUI:
             widget.bind('<ButtonRelease-1>', self._update_gutters_debounced)
 
         self.tableau_text.tag_configure('error', foreground='red')
+        # Track edits so get_fabric_sql only serializes the Tcl buffer back
+        # to Python when the user actually changed something
+        self.fabric_text.bind('<<Modified>>', self._on_fabric_modified)
+
+        # The four panes scroll as one logical region; cache their Tcl paths
+        # and the interpreter handle so the scroll hot path issues direct
+        # tk.call invocations instead of per-widget Python method dispatch
+        self._tk = self.root.tk
+        self._scroll_targets = (self.tableau_text._w, self.fabric_text._w,
+                                self.left_gutter._w, self.right_gutter._w)
     
     def _create_action_section(self, parent):
         """Create the action buttons section."""
@@ -181,8 +348,17 @@ class SQLConverterUI:
         status_label = ttk.Label(status_frame, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
         status_label.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 5))
         
+        # The flagged-items ScrolledText is created lazily on first use:
+        # sessions that never flag anything skip its construction and layout
+        self._status_frame = status_frame
+        self.flagged_text = None
+
+    def _ensure_flagged_widget(self):
+        """Create the flagged-items ScrolledText on first use."""
+        if self.flagged_text is not None:
+            return
         self.flagged_text = scrolledtext.ScrolledText(
-            status_frame,
+            self._status_frame,
             wrap=tk.WORD,
             height=4,
             font=('Courier New', 8)
@@ -198,8 +374,54 @@ class SQLConverterUI:
             self.callbacks['on_browse']()
             
     def _on_load_convert(self):
-        if 'on_convert' in self.callbacks:
+        if 'on_convert' not in self.callbacks:
+            return
+        # Run the (potentially heavy) conversion callback off the Tk thread
+        # so the window stays responsive. The callback can keep calling the
+        # public UI methods directly: each one detects the worker thread via
+        # _dispatch and re-routes itself through the queue, so every Tk
+        # mutation still happens on the main thread.
+        if self._convert_thread is not None and self._convert_thread.is_alive():
+            return
+        self.load_btn.configure(state='disabled')
+        self._convert_thread = threading.Thread(target=self._run_convert, daemon=True)
+        self._convert_thread.start()
+
+    def _run_convert(self):
+        try:
             self.callbacks['on_convert']()
+        finally:
+            self.post('done')
+
+    def post(self, kind, *payload):
+        """Thread-safe: queue a UI update ('status', 'tableau', 'fabric',
+        'flagged', ...) to be applied on the Tk main thread."""
+        self._ui_queue.put((kind, payload))
+
+    def _dispatch(self, kind, *payload):
+        """Called at the top of every public UI mutator: when invoked from a
+        worker thread (e.g. the convert callback), queue the update for the
+        main thread instead -- tkinter widgets must never be touched from
+        another thread. Returns True if the call was re-routed."""
+        if threading.current_thread() is self._ui_thread:
+            return False
+        self.post(kind, *payload)
+        return True
+
+    def _on_convert_finished(self):
+        self.load_btn.configure(state='normal')
+
+    def _drain_ui_queue(self):
+        # Apply a bounded batch of queued updates per tick, then re-schedule
+        for _ in range(20):
+            try:
+                kind, payload = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            handler = self._queue_handlers.get(kind)
+            if handler is not None:
+                handler(*payload)
+        self.root.after(50, self._drain_ui_queue)
             
     def _on_save(self):
         if 'on_save' in self.callbacks:
@@ -212,80 +434,187 @@ class SQLConverterUI:
     # Public UI Methods 
     
     def set_file_path(self, path):
+        if self._dispatch('file_path', path):
+            return
         self.current_file_path = path
         self.file_path_var.set(path)
-        
+
     def set_file_info(self, info_text):
+        if self._dispatch('file_info', info_text):
+            return
         self.file_info_var.set(info_text)
-        
+
     def set_status(self, text):
+        if self._dispatch('status', text):
+            return
         self.status_var.set(text)
-        self.root.update()
+        # update_idletasks flushes paint/layout only, without re-entering
+        # input handling the way a full update() pump does; capped at ~30Hz
+        # so tight progress loops don't spend their time repainting
+        now = time.monotonic()
+        if now - self._last_status_flush >= 0.033:
+            self._last_status_flush = now
+            self.root.update_idletasks()
+
+    @contextmanager
+    def _batch_update(self, widget):
+        """BeginUpdate/EndUpdate analog: detach the widget's scroll sync while
+        a batch of text mutations runs, so each delete/insert doesn't trigger
+        scrollbar reconfiguration and sibling-pane sync; the gutters are
+        refreshed once at the end instead of per mutation."""
+        saved = widget.cget('yscrollcommand')
+        widget.configure(yscrollcommand='')
+        try:
+            yield
+        finally:
+            widget.configure(yscrollcommand=saved)
+            self._refresh_line_numbers()
 
     def set_tableau_sql(self, sql_text):
-        self.tableau_sql = sql_text
-        self.tableau_text.configure(state='normal')
-        self.tableau_text.delete('1.0', tk.END)
-        self.tableau_text.insert('1.0', sql_text)
-        self.tableau_text.configure(state='disabled')
-        self._refresh_line_numbers()
+        if self._dispatch('tableau', sql_text):
+            return
+        line_starts = array('i', [0])
+        find = sql_text.find
+        i = find('\n')
+        while i != -1:
+            line_starts.append(i + 1)
+            i = find('\n', i + 1)
+        self._tableau_line_starts = line_starts
+        # Repopulating wipes the pane's tags, so the next highlight must run
+        self._highlight_sig = None
+        if len(sql_text) > _VIRTUAL_THRESHOLD:
+            head, tail = _split_head(sql_text, _VIRTUAL_CHUNK_LINES)
+        else:
+            head, tail = sql_text, None
+        self._virtual_tail['left'] = tail
+        with self._batch_update(self.tableau_text):
+            self.tableau_text.configure(state='normal')
+            self.tableau_text.delete('1.0', tk.END)
+            self.tableau_text.insert('1.0', head)
+            self.tableau_text.configure(state='disabled')
 
     def set_fabric_sql(self, sql_text):
-        self.fabric_sql = sql_text
-        self.fabric_text.configure(state='normal')
-        self.fabric_text.delete('1.0', tk.END)
-        self.fabric_text.insert('1.0', sql_text)
-        # leave editable so users can change before saving
-        self._refresh_line_numbers()
-        
+        if self._dispatch('fabric', sql_text):
+            return
+        if len(sql_text) > _VIRTUAL_THRESHOLD:
+            head, tail = _split_head(sql_text, _VIRTUAL_CHUNK_LINES)
+        else:
+            head, tail = sql_text, None
+        self._virtual_tail['right'] = tail
+        with self._batch_update(self.fabric_text):
+            # Suspend the undo stack for the bulk population: recording the
+            # delete and insert would mirror the whole document into undo
+            # records the user can never meaningfully undo anyway
+            self.fabric_text.configure(state='normal', undo=False, autoseparators=False)
+            self.fabric_text.delete('1.0', tk.END)
+            self.fabric_text.insert('1.0', head)
+            self.fabric_text.edit_reset()
+            self.fabric_text.configure(undo=True, autoseparators=True)
+            # leave editable so users can change before saving
+        self.fabric_text.edit_modified(False)
+        self._fabric_cache = sql_text
+
+    def _on_fabric_modified(self, event=None):
+        # Fires once per modified-flag transition; resetting the flag keeps
+        # the next edit firing it again. Programmatic loads reset the flag
+        # before repopulating the cache, so only user edits invalidate it.
+        if self.fabric_text.edit_modified():
+            self._fabric_cache = None
+            self.fabric_text.edit_modified(False)
+
     def get_fabric_sql(self):
-        return self.fabric_text.get('1.0', tk.END).rstrip()
+        # Convert-then-save without edits returns the cached string without
+        # marshalling the whole Tcl buffer back to Python
+        if self._fabric_cache is not None:
+            return self._fabric_cache.rstrip()
+        # Edits can only touch the loaded head, so widget content plus the
+        # unloaded tail is always the full document
+        text = self.fabric_text.get('1.0', tk.END).rstrip()
+        tail = self._virtual_tail['right']
+        return text if tail is None else text + '\n' + tail
+
+    def _get_tableau_text(self):
+        text = self.tableau_text.get('1.0', 'end-1c')
+        tail = self._virtual_tail['left']
+        return text if tail is None else text + '\n' + tail
 
     def enable_save_button(self):
+        if self._dispatch('enable_save'):
+            return
         self.save_btn.configure(state='normal')
-        
+
     def disable_save_button(self):
+        if self._dispatch('disable_save'):
+            return
         self.save_btn.configure(state='disabled')
 
     def display_flagged_items(self, flagged_items, metrics=None):
+        if self._dispatch('flagged', flagged_items, metrics):
+            return
         self.flagged_items = flagged_items
         self.current_metrics = metrics
-        
-        self.flagged_text.configure(state='normal')
-        self.flagged_text.delete('1.0', tk.END)
-        
+        # Snapshot the metrics dict once; _highlight_from_metrics reuses it
+        # instead of re-serializing the same object moments later
+        self._metrics_dict = metrics.to_dict() if metrics else None
+        self._ensure_flagged_widget()
+
+        # Build the report body and the highlight ranges in Python first,
+        # then talk to Tk once: one insert for the text and one batched
+        # tag_remove/tag_add for the line highlights, instead of a state
+        # flip and several Tcl calls per flagged item
         if not flagged_items:
-            self.flagged_text.insert('1.0', "✓ No flagged items - all conversions successful!")
+            body = "✓ No flagged items - all conversions successful!"
         else:
-            header = f"⚠ {len(flagged_items)} ITEM(S) REQUIRE MANUAL REVIEW:\n" + "="*70 + "\n\n"
-            self.flagged_text.insert('1.0', header)
-            
+            pieces = [f"⚠ {len(flagged_items)} ITEM(S) REQUIRE MANUAL REVIEW:\n" + "="*70 + "\n\n"]
             for line_num, reason in flagged_items:
-                item_text = f"Line {line_num}: {reason}\n"
-                self.flagged_text.insert(tk.END, item_text)
-                # Highlight those lines in the Tableau pane (red)
-                try:
-                    if line_num and isinstance(line_num, int) and line_num > 0:
-                        start = f"{line_num}.0"
-                        end = f"{line_num}.end"
-                        self.tableau_text.configure(state='normal')
-                        self.tableau_text.tag_remove('error', start, end)
-                        self.tableau_text.tag_add('error', start, end)
-                        self.tableau_text.configure(state='disabled')
-                except Exception:
-                    pass
-            
+                pieces.append(f"Line {line_num}: {reason}\n")
+
             # Add unsupported functions if any
-            if metrics:
-                metrics_dict = metrics.to_dict()
-                unsupported = metrics_dict.get('unsupported_functions', [])
+            if self._metrics_dict:
+                unsupported = self._metrics_dict.get('unsupported_functions', [])
                 if unsupported:
-                    self.flagged_text.insert(tk.END, f"\n\nUnsupported Functions: {', '.join(unsupported)}\n")
-        
+                    pieces.append(f"\n\nUnsupported Functions: {', '.join(unsupported)}\n")
+            body = "".join(pieces)
+
+        self.flagged_text.configure(state='normal')
+        self.flagged_text.delete('1.0', tk.END)
+        self.flagged_text.insert('1.0', body)
         self.flagged_text.configure(state='disabled')
-        self._highlight_from_metrics()
+
+        # Highlight those lines in the Tableau pane (red). When reconverting
+        # the same file produces the same flags and unsupported functions,
+        # the tags from the previous run are still correct (set_tableau_sql
+        # invalidates the signature whenever the pane content changes), so
+        # the whole tagging and pattern-scan pass is skipped.
+        unsupported = self._metrics_dict.get('unsupported_functions', frozenset()) if self._metrics_dict else frozenset()
+        sig = (tuple(flagged_items), unsupported)
+        if sig != self._highlight_sig:
+            self._tag_flagged_lines()
+            self._highlight_from_metrics()
+            self._highlight_sig = sig
         self._refresh_line_numbers()
 
+    def _tag_flagged_lines(self):
+        """Tag every flagged line currently loaded in the Tableau pane."""
+        # While the pane is only partially loaded, line numbers past the
+        # loaded head would be clamped by Tk onto the last visible line, so
+        # they are held back until _load_more_chunks brings their text in
+        loaded = self._line_counts['left'] if self._virtual_tail['left'] is not None else None
+        ranges = []
+        for line_num, _reason in self.flagged_items:
+            if line_num and isinstance(line_num, int) and line_num > 0:
+                if loaded is None or line_num <= loaded:
+                    ranges += (f"{line_num}.0", f"{line_num}.end")
+        try:
+            self.tableau_text.configure(state='normal')
+            self.tableau_text.tag_remove('error', '1.0', tk.END)
+            if ranges:
+                self.tableau_text.tag_add('error', *ranges)
+        except Exception:
+            pass
+        finally:
+            self.tableau_text.configure(state='disabled')
+
     def clear_all(self):
         # Clear text areas
         self.tableau_text.configure(state='normal')
@@ -296,156 +625,265 @@ class SQLConverterUI:
         self.fabric_text.delete('1.0', tk.END)
         self.fabric_text.configure(state='disabled')
         
-        self.flagged_text.configure(state='normal')
-        self.flagged_text.delete('1.0', tk.END)
-        self.flagged_text.insert('1.0', "Flagged items will appear here...")
-        self.flagged_text.configure(state='disabled')
+        if self.flagged_text is not None:
+            self.flagged_text.configure(state='normal')
+            self.flagged_text.delete('1.0', tk.END)
+            self.flagged_text.insert('1.0', "Flagged items will appear here...")
+            self.flagged_text.configure(state='disabled')
         
         # Reset variables
         self.current_file_path = None
         self.file_path_var.set("")
         self.file_info_var.set("No file loaded")
-        self.tableau_sql = ""
-        self.fabric_sql = ""
         self.current_metrics = None
+        self._metrics_dict = None
         self.flagged_items = []
+        self._tableau_line_starts = None
+        self._virtual_tail = {'left': None, 'right': None}
+        self._fabric_cache = None
+        self._highlight_sig = None
         
         self.disable_save_button()
         self.status_var.set("Ready. Please load a SQL file to begin.")
 
     def show_info(self, title, message):
+        # Modal dialogs grab from the calling thread; re-routing keeps a
+        # worker-thread grab from deadlocking against the event loop
+        if self._dispatch('info', title, message):
+            return
         messagebox.showinfo(title, message)
-        
+
     def show_warning(self, title, message):
+        if self._dispatch('warning', title, message):
+            return
         messagebox.showwarning(title, message)
-        
+
     def show_error(self, title, message):
+        if self._dispatch('error', title, message):
+            return
         messagebox.showerror(title, message)
 
     def _highlight_from_metrics(self):
         """Highlight lines containing unsupported or special-case functions."""
         try:
-            if not self.current_metrics or not self.tableau_sql:
+            if not self.current_metrics:
                 return
-            # Build set of line numbers to highlight
-            lines_to_mark = set()
-            content_lines = self.tableau_sql.split('\n')
-            # Unsupported functions
-            metrics = self.current_metrics.to_dict()
-            for func in metrics.get('unsupported_functions', []):
-                try:
-                    import re
-                    pattern = re.compile(r"\\b" + re.escape(func) + r"\\s*\\(", re.IGNORECASE)
-                except Exception:
-                    pattern = None
-                if pattern:
-                    for idx, line in enumerate(content_lines, start=1):
-                        if pattern.search(line):
-                            lines_to_mark.add(idx)
-            # Special patterns that require manual rewrite
-            special_patterns = [r'\\bSTARTSWITH\\s*\\(', r'\\bENDSWITH\\s*\\(', r'\\bCONTAINS\\s*\\(']
-            special_patterns.append(r'\{\s*(FIXED|INCLUDE|EXCLUDE)\b')
-            import re
-            specials = [re.compile(pat, re.IGNORECASE) for pat in special_patterns]
-            for idx, line in enumerate(content_lines, start=1):
-                if any(p.search(line) for p in specials):
-                    lines_to_mark.add(idx)
-
-            # Apply tags in the Tableau view
+            content = self._get_tableau_text()
+            if not content:
+                return
+            # One combined alternation (special cases + any unsupported
+            # functions from the metrics) scanned over the whole buffer in a
+            # single C-level pass, instead of per-function per-line searches
+            metrics = self._metrics_dict or self.current_metrics.to_dict()
+            unsupported = metrics.get('unsupported_functions', ())
+
+            # Cheap C-level substring prefilter: when no unsupported function
+            # was reported and none of the special tokens occur anywhere in
+            # the buffer, nothing can match and the regex scan is skipped
+            upper = content.upper()
+            if not unsupported and not any(
+                    tok in upper for tok in
+                    ('STARTSWITH', 'ENDSWITH', 'CONTAINS', 'FIXED', 'INCLUDE', 'EXCLUDE')):
+                return
+
+            combined = _highlight_pattern(tuple(sorted(unsupported)))
+
+            # Offset table precomputed in set_tableau_sql; bisect maps each
+            # match offset to its 1-based line number in O(log N)
+            line_starts = self._tableau_line_starts
+            if line_starts is None:
+                line_starts = array('i', [0])
+                find = content.find
+                i = find('\n')
+                while i != -1:
+                    line_starts.append(i + 1)
+                    i = find('\n', i + 1)
+            lines_to_mark = {bisect_right(line_starts, m.start()) for m in combined.finditer(content)}
+            if self._virtual_tail['left'] is not None:
+                # Matches past the loaded head get tagged when their chunk
+                # streams in (_load_more_chunks re-runs this highlight)
+                loaded = self._line_counts['left']
+                lines_to_mark = {ln for ln in lines_to_mark if ln <= loaded}
+
+            # Apply all tags in one call in the Tableau view
             if lines_to_mark:
-                self.tableau_text.configure(state='normal')
+                ranges = []
                 for ln in lines_to_mark:
-                    try:
-                        self.tableau_text.tag_add('error', f"{ln}.0", f"{ln}.end")
-                    except Exception:
-                        pass
+                    ranges += (f"{ln}.0", f"{ln}.end")
+                self.tableau_text.configure(state='normal')
+                self.tableau_text.tag_add('error', *ranges)
                 self.tableau_text.configure(state='disabled')
         except Exception:
             pass
 
     # Scrolling & Line Numbers
     def _scroll_both_y(self, *args):
-        self.tableau_text.yview(*args)
-        self.fabric_text.yview(*args)
-        self.left_gutter.yview(*args)
-        self.right_gutter.yview(*args)
+        call = self._tk.call
+        for target in self._scroll_targets:
+            call(target, 'yview', *args)
 
     def _sync_scroll_from_left(self, first, last):
-        self.left_scroll.set(first, last)
-        self.right_scroll.set(first, last)
-        self.fabric_text.yview_moveto(first)
-        self.left_gutter.yview_moveto(first)
-        self.right_gutter.yview_moveto(first)
+        # A wheel spin or scrollbar drag fires yscrollcommand once per tick;
+        # only the latest position matters, so record it and fold the whole
+        # burst into a single peer update at idle time. The peers' own
+        # yscrollcommand callbacks during that update are cut off by the
+        # _syncing flag.
+        if self._syncing:
+            return
+        self._sync_target = (0, first, last)
+        if not self._sync_pending:
+            self._sync_pending = True
+            self.root.after_idle(self._apply_sync)
 
     def _sync_scroll_from_right(self, first, last):
-        self.right_scroll.set(first, last)
-        self.left_scroll.set(first, last)
-        self.tableau_text.yview_moveto(first)
-        self.left_gutter.yview_moveto(first)
-        self.right_gutter.yview_moveto(first)
+        if self._syncing:
+            return
+        self._sync_target = (1, first, last)
+        if not self._sync_pending:
+            self._sync_pending = True
+            self.root.after_idle(self._apply_sync)
+
+    def _apply_sync(self):
+        # Apply the most recent recorded position to the scrollbars and to
+        # every pane except the one that originated it
+        self._sync_pending = False
+        source, first, last = self._sync_target
+        self._syncing = True
+        try:
+            self.left_scroll.set(first, last)
+            self.right_scroll.set(first, last)
+            call = self._tk.call
+            for i, target in enumerate(self._scroll_targets):
+                if i != source:
+                    call(target, 'yview', 'moveto', first)
+        finally:
+            self._syncing = False
+        self._maybe_load_tail(last)
+
+    def _maybe_load_tail(self, last):
+        # Progressive loading: once the view nears the bottom of the loaded
+        # head, append the next chunk of any unloaded remainder (deferred to
+        # idle so it runs after the scroll event that triggered it)
+        if self._tail_pending or (self._virtual_tail['left'] is None
+                                  and self._virtual_tail['right'] is None):
+            return
+        if float(last) > 0.85:
+            self._tail_pending = True
+            self.root.after_idle(self._load_more_chunks)
+
+    def _load_more_chunks(self):
+        self._tail_pending = False
+        for side, text in (('left', self.tableau_text), ('right', self.fabric_text)):
+            tail = self._virtual_tail[side]
+            if tail is None:
+                continue
+            chunk, rest = _split_head(tail, _VIRTUAL_CHUNK_LINES)
+            self._virtual_tail[side] = rest
+            # Streaming a chunk in moves text between tail and widget without
+            # changing the document, so the save cache survives the insert
+            fabric_cache = self._fabric_cache
+            with self._batch_update(text):
+                if side == 'left':
+                    text.configure(state='normal')
+                else:
+                    # Streamed-in content is not a user edit; keep it out of
+                    # the Fabric pane's undo stack
+                    text.configure(undo=False, autoseparators=False)
+                text.insert(tk.END, '\n' + chunk)
+                if side == 'left':
+                    text.configure(state='disabled')
+                else:
+                    text.configure(undo=True, autoseparators=True)
+            if side == 'right':
+                text.edit_modified(False)
+                self._fabric_cache = fabric_cache
+        # The freshly loaded Tableau lines may carry flags or highlight
+        # matches that were held back while their text was unloaded
+        if self.flagged_items:
+            self._tag_flagged_lines()
+        self._highlight_from_metrics()
 
     def _on_mousewheel_sync(self, event):
-        delta = -1 * int(event.delta / 120)
-        self.tableau_text.yview_scroll(delta, 'units')
-        self.fabric_text.yview_scroll(delta, 'units')
-        self.left_gutter.yview_scroll(delta, 'units')
-        self.right_gutter.yview_scroll(delta, 'units')
-        self._refresh_line_numbers()
+        # Coalesce wheel events: accumulate the delta and apply it once per
+        # idle cycle, so a trackpad burst costs one scroll of each pane
+        # instead of one per event. Scrolling never changes the line count,
+        # so no gutter refresh is needed here at all.
+        self._wheel_delta += -1 * int(event.delta / 120)
+        if not self._wheel_pending:
+            self._wheel_pending = True
+            self.root.after_idle(self._flush_wheel)
         return 'break'
 
+    def _flush_wheel(self):
+        delta, self._wheel_delta = self._wheel_delta, 0
+        self._wheel_pending = False
+        if delta:
+            call = self._tk.call
+            for target in self._scroll_targets:
+                call(target, 'yview', 'scroll', delta, 'units')
+
     def _refresh_line_numbers(self):
-        for gutter, text in ((self.left_gutter, self.tableau_text), (self.right_gutter, self.fabric_text)):
+        # Incremental refresh: only the delta against the cached line count is
+        # inserted or deleted, so the common case (click/scroll/keystroke with
+        # no line-count change) costs one index read per pane and rewrites
+        # nothing instead of rebuilding both gutters from scratch
+        call = self._tk.call
+        for side, gutter, text in (('left', self.left_gutter, self.tableau_text),
+                                   ('right', self.right_gutter, self.fabric_text)):
+            # Native [count -lines] returns the integer directly, skipping
+            # the index-string allocation, split and parse per refresh
+            total_lines = int(call(text._w, 'count', '-lines', '1.0', 'end'))
+            cached = self._line_counts[side]
+            if total_lines == cached:
+                continue
             gutter.configure(state='normal')
-            gutter.delete('1.0', tk.END)
-            last_index = text.index('end-1c')
-            total_lines = int(str(last_index).split('.')[0])
-            lines = "\n".join(str(i) for i in range(1, total_lines + 1))
-            gutter.insert('1.0', lines)
+            if total_lines > cached:
+                numbers = _gutter_block(cached + 1, total_lines)
+                gutter.insert(tk.END, numbers if cached == 0 else "\n" + numbers)
+            else:
+                gutter.delete(f"{total_lines}.end", tk.END)
             gutter.configure(state='disabled')
+            self._line_counts[side] = total_lines
 
     def _update_gutters_debounced(self, event=None):
-        self.root.after(50, self._refresh_line_numbers)
+        # Trailing-edge debounce: each event cancels the previously scheduled
+        # refresh, so a burst of keystrokes produces exactly one refresh
+        # ~80ms after the last one instead of one per event
+        if self._gutter_after_id is not None:
+            self.root.after_cancel(self._gutter_after_id)
+        self._gutter_after_id = self.root.after(80, self._do_gutter_refresh)
+
+    def _do_gutter_refresh(self):
+        self._gutter_after_id = None
+        # Defer the actual refresh to idle time so it strictly runs after the
+        # current event (and any in-flight text mutation) has finished,
+        # instead of re-entering mid-event when something pumps the queue
+        self.root.after_idle(self._refresh_line_numbers)
     
     def _show_help(self):
-        """Display help information."""
-        help_text = """
-TABLEAU TO FABRIC SQL CONVERTER - HELP
-
-HOW TO USE:
-1. Click 'Browse...' to select a Tableau SQL file (.sql or .txt)
-2. Click 'Load & Convert' to convert the SQL
-3. Review the converted SQL in the right pane
-4. Check 'Flagged Items' section for any items needing manual review
-5. Click 'Save Converted SQL' to save the result
-6. You can edit the Fabric SQL pane directly before saving.
+        """Display help information, reusing one hidden Toplevel."""
+        # The window is built once and then withdrawn on close instead of
+        # destroyed, so repeat Help clicks just re-show the existing widget
+        # tree rather than rebuilding and re-laying-out an identical one
+        window = getattr(self, '_help_window', None)
+        if window is not None and window.winfo_exists():
+            window.deiconify()
+            window.lift()
+            return
 
-SUPPORTED CONVERSIONS:
-• Date Functions (DATEADD, NOW, TODAY, MAKEDATE, etc.)
-• String Functions (LENGTH, SUBSTR, CONTAINS, etc.)
-• Aggregate Functions (SUM, AVG, COUNT, MEDIAN, etc.)
-• Logical Functions (IF, IFNULL, etc.)
-• Mathematical Functions (ROUND, SQRT, LN, LOG, etc.)
-• Any other unsupported functions will be flagged for manual review (Program shall recieve incremental updates)
-
-FLAGGED ITEMS:
-If certain functions or syntax cannot be automatically converted,
-they will be flagged for manual review. These items will appear
-in the 'Flagged Items' section with explanations.
-
-For more information, see the README.md file.
-        """
-        
         help_window = tk.Toplevel(self.root)
         help_window.title("Help - SQL Converter")
         help_window.geometry("600x500")
         
         help_text_widget = scrolledtext.ScrolledText(help_window, wrap=tk.WORD, font=('Arial', 10))
         help_text_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        help_text_widget.insert('1.0', help_text)
+        help_text_widget.insert('1.0', _HELP_TEXT)
         help_text_widget.configure(state='disabled')
         
-        close_btn = ttk.Button(help_window, text="Close", command=help_window.destroy)
+        close_btn = ttk.Button(help_window, text="Close", command=help_window.withdraw)
         close_btn.pack(pady=(0, 10))
+        help_window.protocol('WM_DELETE_WINDOW', help_window.withdraw)
+        self._help_window = help_window
     
     def run(self):
         """Start the UI main loop."""
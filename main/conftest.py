@@ -0,0 +1,29 @@
+"""
+Pytest configuration for the test suite.
+
+Registers the main/ directory on sys.path exactly once per session so test
+modules can import from components/ without repeating the sys.path boilerplate.
+"""
+
+import sys
+import pathlib
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent))
+
+from components.data_cleaner import SQLCleaner
+
+_SAMPLE_DIR = pathlib.Path(__file__).resolve().parent / "sample_queries" / "Input" / "Tableau"
+
+
+@pytest.fixture(scope="session")
+def prepared_tableau_sample():
+    """
+    Read and clean the Tableau sample file once per session.
+
+    Tests consume the cached prepare_for_parsing() result directly instead of
+    re-running the cleaner passes in every test.
+    """
+    raw = (_SAMPLE_DIR / "1.sql").read_text(encoding="utf-8")
+    return SQLCleaner().prepare_for_parsing(raw)
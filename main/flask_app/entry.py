@@ -1,4 +1,6 @@
 import sys
+from collections import OrderedDict
+from functools import lru_cache
 from flask import Flask, request
 from flask import render_template
 from pathlib import Path
@@ -11,6 +13,23 @@ app = Flask(__name__)
 converter = SQLConverter()
 cleaner = SQLCleaner()
 
+# Repeated submits usually contain the same statements; memoize each
+# statement's conversion in a small LRU so re-posts skip the remap and
+# formatting passes. The cached flags are immutable tuples, so sharing the
+# references across requests is safe.
+_STMT_CACHE = OrderedDict()
+_STMT_CACHE_MAX = 256
+
+
+# Users iterate on a query by resubmitting with small tweaks, and browser
+# refreshes re-post identical text; memoize the whole clean/strip/split
+# pipeline on the raw submission so repeats skip it entirely.
+@lru_cache(maxsize=128)
+def _prepare_statements(raw_sql):
+    cleaned_sql = cleaner.clean_query(raw_sql)
+    no_comments_sql, _ = cleaner.extract_comments(cleaned_sql)
+    return tuple(cleaner.split_statements(no_comments_sql))
+
 @app.route("/", methods=["GET", "POST"])
 def index():
     tableau_sql = ""
@@ -22,15 +41,31 @@ def index():
         
         if tableau_sql:
             try:
-                cleaned_sql = cleaner.clean_query(tableau_sql)
-                no_comments_sql, _ = cleaner.extract_comments(cleaned_sql)
-                statements = cleaner.split_statements(no_comments_sql)
+                statements = _prepare_statements(tableau_sql)
+
+                # Deduplicate before converting: the engine runs once per
+                # unique statement (via convert_many), with the LRU carrying
+                # results across submits; duplicates map back from `results`
+                results = {}
+                misses = []
+                for statement in dict.fromkeys(statements):
+                    cached = _STMT_CACHE.get(statement)
+                    if cached is not None:
+                        _STMT_CACHE.move_to_end(statement)
+                        results[statement] = cached
+                    else:
+                        misses.append(statement)
+
+                for statement, (converted, _metrics, flagged) in converter.convert_many(misses).items():
+                    results[statement] = (converted, flagged)
+                    _STMT_CACHE[statement] = (converted, flagged)
+                    if len(_STMT_CACHE) > _STMT_CACHE_MAX:
+                        _STMT_CACHE.popitem(last=False)
 
                 converted_statements = []
                 errors = []
-                
                 for statement in statements:
-                    fabric_sql, metrics, flagged = converter.convert_query(statement)
+                    fabric_sql, flagged = results[statement]
                     converted_statements.append(fabric_sql)
                     errors.append(flagged)
                 '''
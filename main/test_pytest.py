@@ -1,10 +1,16 @@
+"""
+Test suite for the converter components.
+
+Each test builds its own objects and no module-level mutable state is shared
+between tests, so the suite can be parallelized with pytest-xdist
+(pytest -n auto) without any changes.
+"""
+
 import pytest
-import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent))
 from components.data_cleaner import SQLCleaner
 from components.sql_parser import SQLConverter
+from components.sql_mappings import TableauFabricMappings
 from components.Regex_remapping import apply_regex_remapping
 
 class TestSQLCleaner:
@@ -29,6 +35,56 @@ class TestSQLCleaner:
         assert output == "SELECT * FROM table WHERE id = 1"
 
 
+class TestTableauFabricMappings:
+    def test_is_mapped_function(self):
+        mappings = TableauFabricMappings()
+
+        # Bare boolean asserts instead of == True / == False
+        assert mappings.is_mapped_function('NOW')
+        assert mappings.is_mapped_function('now')
+        assert not mappings.is_mapped_function('NOT_A_FUNCTION')
+
+    def test_get_fabric_function(self):
+        mappings = TableauFabricMappings()
+
+        assert mappings.get_fabric_function('LENGTH') == 'LEN'
+        assert mappings.get_fabric_function('NOW') == 'GETDATE'
+        assert mappings.get_fabric_function('NOT_A_FUNCTION') is None
+
+
+class TestSQLConverter:
+    def test_function_conversions(self):
+        converter = SQLConverter()
+
+        # Test Input
+        test = "SELECT SUBSTR(name, 1, 3), NOW() FROM table WHERE LENGTH(name) > 2"
+        fabric_sql, metrics, flagged = converter.convert_query(test)
+
+        # Uppercase once and assert against the local copy instead of
+        # re-allocating fabric_sql.upper() per assertion
+        upper_sql = fabric_sql.upper()
+
+        assert 'SUBSTRING' in upper_sql
+        assert 'GETDATE' in upper_sql
+        assert 'LEN' in upper_sql
+
+
+class TestSQLConversionWithSampleFiles:
+    def test_sample_file_conversion(self, prepared_tableau_sample):
+        converter = SQLConverter()
+
+        # Cleaned once per session by the conftest fixture
+        cleaned = prepared_tableau_sample['cleaned_query']
+        fabric_sql, metrics, flagged = converter.convert_query(cleaned)
+
+        upper_sql = fabric_sql.upper()
+
+        assert 'SUBSTRING' in upper_sql
+        assert 'GETDATE' in upper_sql
+        # MEDIAN and LOD expressions should be flagged for manual review
+        assert flagged
+
+
 class TestCommentExtraction:
     def test_extract_comments(self):
         cleaner = SQLCleaner()